@@ -1,18 +1,15 @@
 import asyncio
 from agents import Agent, Runner
-from agents.extensions.models.litellm_provider import LitellmProvider
-from backend.app.core.config import OLLAMA_MODEL
+from backend.app.core.config import get_ollama_model
 from backend.app.tools.calling_tool import calling_tool
+from backend.app.agents.prompts import CONTACT_SYSTEM
 
 contact_agent = Agent(
     name="Contact Agent",
-    instructions="""
-    You are responsible for calling the best hospital near the accident location using the phone number.
-    Provide a concise, polite, and complete message including the type of accident, exact location, and any relevant details.
-    """,
+    instructions=CONTACT_SYSTEM,
     output_type=None,
     tools=[calling_tool],
-    model=LitellmProvider().get_model(f'ollama_chat/{OLLAMA_MODEL}')
+    model=get_ollama_model()
 )
 
 async def main():
@@ -23,4 +20,9 @@ async def main():
     print(result.final_output)
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -1,42 +1,50 @@
 import asyncio
 from agents import Agent, Runner
-from agents.extensions.models.litellm_provider import LitellmProvider
-from openai_harmony import ToolDescription
-from backend.app.core.config import OLLAMA_MODEL
+from backend.app.core.config import get_json_model_settings, get_ollama_model
 from backend.app.tools.fetch_nearest_hospital import fetch_nearest_hospital
+from backend.app.models.hospital_info import HOSPITAL_INFO_SCHEMA
 from backend.app.models.location_context import LocationContext
+from backend.app.agents.prompts import HOSPITAL_FINDER_SYSTEM
 
 hospital_finder_agent = Agent(
     name="Hospital Finder Agent",
-    instructions="""
-    You are a trauma responder. Your job is to search for the nearest hospital to the accident
-    return only the hospital info in JSON format with these fields, respond unknown if you don't have the answer:
-    {
-        "name": "string" or "unknown",
-        "address": "string" or "unknown",
-        "rating": "string" or "unknown",
-        "user_ratings_total": "string" or "unknown",
-        "phone_number": "string" or "unknown",
-    }
-    """,
+    instructions=HOSPITAL_FINDER_SYSTEM,
     output_type=None,
     tools=[fetch_nearest_hospital],
-    model=LitellmProvider().get_model(f'ollama_chat/{OLLAMA_MODEL}')
+    model=get_ollama_model(),
+    model_settings=get_json_model_settings(HOSPITAL_INFO_SCHEMA)
 )
 
 async def main():
-    location_context = LocationContext(latitude="12.9345", longitude="77.6107")
-    print(await Runner.run(
-            hospital_finder_agent, 
-            context=location_context,
-            input=(
-                "You are a first responder at the scene of a road accident. "
-                "The patient has heavy bleeding and a deep cut, categorized as a minor accident. "
-                "Find the nearest hospital to the given location latitude=12.9345, longitude=77.6107 and return only a JSON object with: "
-                "name, address, rating, user_ratings_total, and phone_number."
+    # Gather the demo lookups so the Ollama calls overlap on one event loop
+    # instead of completing serially.
+    locations = [
+        LocationContext(latitude=12.9345, longitude=77.6107),
+        LocationContext(latitude=12.9757, longitude=77.6192),
+    ]
+    results = await asyncio.gather(
+        *[
+            Runner.run(
+                hospital_finder_agent,
+                context=location,
+                input=(
+                    "You are a first responder at the scene of a road accident. "
+                    "The patient has heavy bleeding and a deep cut, categorized as a minor accident. "
+                    f"Find the nearest hospital to the given location latitude={location.latitude}, longitude={location.longitude} and return only a JSON object with: "
+                    "name, address, rating, user_ratings_total, and phone_number."
+                ),
             )
-    ))
+            for location in locations
+        ]
+    )
+    for result in results:
+        print(result)
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
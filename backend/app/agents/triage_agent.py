@@ -1,16 +1,38 @@
-from agents import Agent
+import asyncio
+
+from agents import Runner
 
 from backend.app.agents.contact_agent import contact_agent
 from backend.app.agents.accident_response_agent import accident_response_agent
+from backend.app.agents.hospital_finder_agent import hospital_finder_agent
+from backend.app.models.accident_report import AccidentReport
+
 
+async def run_triage(user_input, location_context):
+    """Run the accident classifier and hospital finder concurrently.
 
-triage_agent = Agent(
-    name="Triage Agent",
-    instructions="""
-    You are responsible for deciding how to route accident cases:
-    1. Always start by using the Accident Response Agent.
-    2. If JSON returned by Accident Response Agent is valid and contains suficient information, handoff to Hospital Finder Agent to find the nearest hospital .
-    3. If the accident is "major trauma", hand off to the Contact Agent to call the nearest hospital.
-    """,
-    handoffs=[accident_response_agent, contact_agent],
-)
\ No newline at end of file
+    The hospital finder only needs the latitude/longitude already present in
+    the user request, so both prompts can hit Ollama at the same time and get
+    batched server-side instead of queueing one behind the other. Only the
+    contact step stays serial, since it needs both the classification and
+    the chosen hospital. Critical path drops from
+    T_accident + T_hospital + T_contact to
+    max(T_accident, T_hospital) + T_contact.
+    """
+    accident_result, hospital_result = await asyncio.gather(
+        Runner.run(accident_response_agent, input=user_input),
+        Runner.run(hospital_finder_agent, context=location_context, input=user_input),
+    )
+    # The classifier emits JSON text (final_output_as is only a typing
+    # cast); parse it before branching on accident_type.
+    accident_report = AccidentReport.model_validate_json(accident_result.final_output)
+    if accident_report.accident_type == "major trauma":
+        await Runner.run(
+            contact_agent,
+            input=(
+                f"Call the hospital below about a {accident_report.accident_type} accident "
+                f"at {accident_report.location}. Details: {accident_report.details}\n"
+                f"Hospital: {hospital_result.final_output}"
+            ),
+        )
+    return accident_result, hospital_result
\ No newline at end of file
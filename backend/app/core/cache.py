@@ -0,0 +1,86 @@
+import pickle
+import time
+from collections import OrderedDict
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis is optional; caching degrades to in-process
+    aioredis = None
+
+
+class TTLCache:
+    """Small in-process LRU with per-entry TTL.
+
+    Acts as the L1 in front of any shared store: hits are a dict lookup,
+    the LRU bound keeps hot keys resident, and expired or evicted entries
+    simply fall through to recomputation.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl: float = None) -> None:
+        if key in self._data:
+            self._data.move_to_end(key)
+        elif len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (time.monotonic() + (ttl if ttl is not None else self.ttl), value)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+
+class SharedTTLCache:
+    """TTLCache with an optional Redis tier shared across workers.
+
+    Local hits stay a dict lookup; misses consult Redis (when configured)
+    so multi-worker deployments share one analysis cache and survive
+    restarts. Without redis installed or REDIS_URL set, behaves exactly
+    like the in-process cache. Keys must be strings.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0, redis_url: str = ""):
+        self.ttl = ttl
+        self._local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._redis = aioredis.from_url(redis_url) if redis_url and aioredis else None
+
+    async def get(self, key: str):
+        value = self._local.get(key)
+        if value is not None or self._redis is None:
+            return value
+        try:
+            blob = await self._redis.get(key)
+        except Exception:
+            return None
+        if blob is None:
+            return None
+        value = pickle.loads(blob)
+        self._local.set(key, value)
+        return value
+
+    async def set(self, key: str, value, ttl: float = None) -> None:
+        self._local.set(key, value, ttl)
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, pickle.dumps(value),
+                                      ex=int(ttl if ttl is not None else self.ttl))
+            except Exception:
+                # Redis being down must never fail a request; the local
+                # tier still has the entry.
+                pass
+
+    async def contains(self, key: str) -> bool:
+        return await self.get(key) is not None
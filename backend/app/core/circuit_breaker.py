@@ -0,0 +1,35 @@
+import time
+
+
+class CircuitBreaker:
+    """Fast-fail switch for a flaky upstream.
+
+    After fail_max consecutive failures the circuit opens and allow()
+    returns False, so callers can serve a fallback instantly instead of
+    burning the full connect+TLS+timeout budget per request during an
+    outage. After reset_timeout one probe call is let through; success
+    closes the circuit again.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow(self) -> bool:
+        if self._failures < self.fail_max:
+            return True
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            # Half-open: let one probe through; a failure reopens.
+            self._failures = self.fail_max - 1
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.fail_max:
+            self._opened_at = time.monotonic()
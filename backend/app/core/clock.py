@@ -0,0 +1,27 @@
+import asyncio
+from datetime import datetime
+
+# Refreshed by a background ticker so hot paths read a plain string
+# instead of paying datetime.now() + isoformat() per request.
+TICK_SECONDS = 0.1
+
+_now_iso = datetime.now().isoformat()
+_ticker_task = None
+
+
+def now_iso() -> str:
+    """Current time as an ISO string, fresh to within TICK_SECONDS."""
+    return _now_iso
+
+
+async def _tick() -> None:
+    global _now_iso
+    while True:
+        _now_iso = datetime.now().isoformat()
+        await asyncio.sleep(TICK_SECONDS)
+
+
+def start_ticker() -> None:
+    global _ticker_task
+    if _ticker_task is None:
+        _ticker_task = asyncio.create_task(_tick())
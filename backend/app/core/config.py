@@ -1,17 +1,59 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "OpenAI Hackathon"
     API_V1_PREFIX: str = "/v1"
+    DEBUG: bool = False
     OPENAI_API_KEY: str
     GOOGLE_MAPS_API_KEY: str
     TWILIO_PHONE_NUMBER: str
     ACCOUNT_SID: str
     AUTH_TOKEN: str
+    # Optional shared cache backend; empty means in-process caching only.
+    REDIS_URL: str = ""
+
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse .env/validate once per process instead of per import."""
+    return Settings()
+
+settings = get_settings()
+
+OLLAMA_MODEL = 'gpt-oss:20b'
+
+@lru_cache(maxsize=1)
+def get_ollama_model():
+    """Return the shared Ollama model handle.
+
+    Every agent talks to the same model, so build the provider and model
+    once per process instead of once per agent module.
+    """
+    from agents.extensions.models.litellm_provider import LitellmProvider
+
+    return LitellmProvider().get_model(f'ollama_chat/{OLLAMA_MODEL}')
 
-    class Config:
-        env_file = ".env"
+def get_json_model_settings(schema=None):
+    """Generation settings for agents that must emit a short JSON object.
 
-settings = Settings()
+    Passing a precompiled model_json_schema() as format= makes Ollama's
+    grammar-constrained decoder guarantee schema-valid JSON and stop as
+    soon as it is satisfied; plain format='json' is the fallback.
+    num_predict caps decode length either way.
+    """
+    from agents import ModelSettings
 
-OLLAMA_MODEL = 'gpt-oss:20b'
\ No newline at end of file
+    return ModelSettings(
+        temperature=0.0,
+        max_tokens=256,
+        extra_args={
+            "format": schema if schema is not None else "json",
+            # keep_alive=-1 pins gpt-oss:20b in memory so an idle gap never
+            # triggers a multi-GB model reload on the next request.
+            "keep_alive": -1,
+            "options": {"num_predict": 256, "stop": ["```"]},
+        },
+    )
\ No newline at end of file
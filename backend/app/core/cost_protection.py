@@ -0,0 +1,183 @@
+import asyncio
+import os
+import time
+
+import orjson
+from collections import defaultdict
+from datetime import datetime
+from dotenv import load_dotenv
+
+# pydantic-settings parses .env privately into Settings; the reads below
+# go through os.environ, so load the file here or the CLI's `demo on` /
+# `limits` writes would never reach a freshly started server.
+load_dotenv()
+
+USAGE_FILE = os.path.join(os.path.dirname(__file__), "..", "..", "api_usage.json")
+
+# Daily caps per external API so a runaway demo cannot burn credits.
+# Overridable from .env via the cost_protection_cli `limits` command.
+DAILY_LIMITS = {
+    "openai": int(os.getenv("DAILY_LIMIT_OPENAI", "200")),
+    "google_maps": int(os.getenv("DAILY_LIMIT_GOOGLE_MAPS", "100")),
+    "twilio": int(os.getenv("DAILY_LIMIT_TWILIO", "20")),
+}
+
+FLUSH_INTERVAL_SECONDS = 5
+
+# Days of history kept in api_usage.json; ISO date keys sort
+# lexicographically, so pruning is a sorted-slice delete.
+RETENTION_DAYS = 31
+
+# Read once at import instead of an os.getenv + lower + compare on every
+# request; set_demo_mode() exists for runtime toggling (and tests).
+_DEMO_MODE = os.getenv("DEMO_MODE", "false").lower() == "true"
+
+
+def set_demo_mode(enabled: bool) -> None:
+    global _DEMO_MODE
+    _DEMO_MODE = enabled
+
+
+_today_stamp = None
+_today_str = ""
+
+
+def _today() -> str:
+    """Today's date string, formatted once per day instead of per call.
+
+    Every charge/report used to pay a datetime.now().strftime; this
+    re-formats only when the coarse day bucket rolls over.
+    """
+    global _today_stamp, _today_str
+    # Minute-level bucket: hour buckets miss local midnight in half-hour
+    # offset timezones (IST is +5:30), mischarging up to 30 minutes of
+    # requests to the previous day.
+    stamp = int(time.time() // 60)
+    if stamp != _today_stamp:
+        _today_stamp = stamp
+        _today_str = datetime.now().strftime("%Y-%m-%d")
+    return _today_str
+
+
+class CostProtection:
+    """Tracks per-day API usage against DAILY_LIMITS.
+
+    Counters live in memory and are flushed to disk by a background task,
+    so tracking a request is a dict increment instead of a full
+    load/dump of the usage file on every call.
+    """
+
+    def __init__(self, usage_file: str = USAGE_FILE):
+        self.usage_file = usage_file
+        self._usage = defaultdict(lambda: defaultdict(int))
+        self._dirty = False
+        self._lock = asyncio.Lock()
+        self._flusher_task = None
+        self._load()
+
+    def _load(self) -> None:
+        if os.path.exists(self.usage_file):
+            with open(self.usage_file, "rb") as f:
+                for day, counts in orjson.loads(f.read()).items():
+                    self._usage[day] = defaultdict(int, counts)
+
+    def _snapshot(self) -> dict:
+        """Prune and copy the counters; must run on the event loop.
+
+        The flusher serializes in a worker thread, and handlers mutate
+        the live dicts on the loop — iterating them off-loop can hit
+        "dictionary changed size during iteration" the moment a new day
+        or request type appears, silently killing the flusher. So the
+        copy happens here, synchronously with the mutators, and only the
+        detached snapshot crosses the thread boundary.
+        """
+        # Bound the file: without pruning it grows forever and every
+        # load/flush (service startup, each CLI run) re-parses all of it.
+        if len(self._usage) > RETENTION_DAYS:
+            for day in sorted(self._usage)[:-RETENTION_DAYS]:
+                del self._usage[day]
+        return {day: dict(counts) for day, counts in self._usage.items()}
+
+    def _write(self, snapshot: dict = None) -> None:
+        if snapshot is None:  # direct CLI use, no event loop involved
+            snapshot = self._snapshot()
+        with open(self.usage_file, "wb") as f:
+            f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+
+    def can_make_request(self, request_type: str) -> bool:
+        today = _today()
+        limit = DAILY_LIMITS.get(request_type)
+        if limit is None:
+            return True
+        return self._usage[today][request_type] < limit
+
+    def is_demo_mode(self) -> bool:
+        return _DEMO_MODE
+
+    def charge(self, request_type: str) -> bool:
+        """Atomically check the daily limit and count the request.
+
+        One synchronous increment with no await between check and count,
+        so concurrent requests can't slip past the limit the way a
+        separate can_make_request/track_request pair could.
+        """
+        today = _today()
+        limit = DAILY_LIMITS.get(request_type)
+        counts = self._usage[today]
+        if limit is not None and counts[request_type] >= limit:
+            return False
+        counts[request_type] += 1
+        self._dirty = True
+        return True
+
+    def track_request(self, request_type: str) -> None:
+        today = _today()
+        self._usage[today][request_type] += 1
+        self._dirty = True
+
+    def get_usage_report(self) -> dict:
+        today = _today()
+        counts = self._usage[today]
+        # Total computed here in the same pass, so callers never chain
+        # .get() lookups over the nested dict to re-derive it.
+        return {
+            "date": today,
+            "usage": dict(counts),
+            "total_requests": sum(counts.values()),
+            "limits": dict(DAILY_LIMITS),
+            "remaining": {
+                request_type: max(0, limit - counts[request_type])
+                for request_type, limit in DAILY_LIMITS.items()
+            },
+        }
+
+    def reset_daily_usage(self) -> None:
+        today = _today()
+        self._usage[today] = defaultdict(int)
+        self._dirty = True
+
+    async def _flusher(self) -> None:
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            if self._dirty:
+                async with self._lock:
+                    self._dirty = False
+                    snapshot = self._snapshot()
+                await asyncio.to_thread(self._write, snapshot)
+
+    def start(self) -> None:
+        if self._flusher_task is None:
+            self._flusher_task = asyncio.create_task(self._flusher())
+
+    async def shutdown(self) -> None:
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+        if self._dirty:
+            async with self._lock:
+                self._dirty = False
+                snapshot = self._snapshot()
+            await asyncio.to_thread(self._write, snapshot)
+
+
+cost_protection = CostProtection()
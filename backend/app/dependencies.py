@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+from backend.app.service.analysis_service import EmergencyAnalysisService
+from backend.app.service.calling_service import CallingService
+from backend.app.service.hospital_service import HospitalSearchService
+
+# lru_cache makes each service a per-process singleton: one Google Maps
+# client, one cache, one in-flight map — shared by every request instead
+# of rebuilt wherever a module happens to instantiate the class.
+
+@lru_cache(maxsize=1)
+def get_hospital_service() -> HospitalSearchService:
+    return HospitalSearchService()
+
+@lru_cache(maxsize=1)
+def get_analysis_service() -> EmergencyAnalysisService:
+    return EmergencyAnalysisService()
+
+@lru_cache(maxsize=1)
+def get_calling_service() -> CallingService:
+    return CallingService()
@@ -1,10 +1,24 @@
+import asyncio
+
+import httpx
+import litellm
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:  # uvloop is not available on Windows
+    pass
 from backend.app.core.config import settings
+from backend.app.core.clock import start_ticker
+from backend.app.core.cost_protection import cost_protection
+from backend.app.dependencies import get_analysis_service
 from .routes import router as api_router
 from fastapi.middleware.cors import CORSMiddleware
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.PROJECT_NAME)
+    app = FastAPI(title=settings.PROJECT_NAME, default_response_class=ORJSONResponse)
     app.include_router(api_router, prefix=settings.API_V1_PREFIX)
     app.add_middleware(
     CORSMiddleware,
@@ -13,6 +27,48 @@ def create_app() -> FastAPI:
     allow_methods=["*"],
     allow_headers=["*"],
 )
+
+    @app.on_event("startup")
+    async def start_cost_protection():
+        cost_protection.start()
+        start_ticker()
+
+    @app.on_event("startup")
+    async def open_http_pool():
+        # One keep-alive pool for all Ollama traffic instead of a fresh
+        # TCP connection per Runner.run.
+        app.state.http = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=30.0,
+        )
+        litellm.aclient_session = app.state.http
+
+    @app.on_event("startup")
+    async def warm_scenario_cache():
+        # Precompute canned-scenario analyses in the background so they
+        # don't delay the first request or the startup probe.
+        asyncio.create_task(get_analysis_service().warm_cache())
+
+    @app.on_event("shutdown")
+    async def flush_cost_protection():
+        await cost_protection.shutdown()
+
+    @app.on_event("shutdown")
+    async def close_analysis_session():
+        await get_analysis_service().close()
+
+    @app.on_event("shutdown")
+    async def close_http_pool():
+        litellm.aclient_session = None
+        await app.state.http.aclose()
+
     return app
 
-app = create_app()
\ No newline at end of file
+app = create_app()
+
+if __name__ == "__main__":
+    # Single canonical runner; see backend/run_server.py for the
+    # single-worker rationale (in-process cost caps).
+    from backend.run_server import main
+
+    main()
\ No newline at end of file
@@ -1,7 +1,17 @@
-from pydantic import BaseModel
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
 
 class AccidentReport(BaseModel):
-    accident_type: str 
+    accident_type: str
     first_aid_tips: str
     location: str
-    details: str
\ No newline at end of file
+    details: str
+    # default_factory so each report gets its own creation time instead of
+    # one timestamp snapshotted when the class is defined.
+    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+# Derived once at import; reused as the Ollama structured-output format.
+ACCIDENT_REPORT_SCHEMA = AccidentReport.model_json_schema()
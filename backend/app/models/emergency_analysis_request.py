@@ -0,0 +1,11 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+class EmergencyAnalysisRequest(BaseModel):
+    message: str
+    location: Optional[str] = None
+    scenario_type: str = "custom-emergency"
+    force_new_analysis: bool = False
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
@@ -0,0 +1,9 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+class EmergencyReportRequest(BaseModel):
+    message: str
+    location: Optional[str] = None
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
@@ -1,8 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class HospitalInfo(BaseModel):
     name: str
     address: str
-    rating: str
-    user_ratings_total: str
-    phone_number: str
\ No newline at end of file
+    rating: float
+    user_ratings_total: int
+    phone_number: str
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+# Derived once at import; reused as the Ollama structured-output format.
+HOSPITAL_INFO_SCHEMA = HospitalInfo.model_json_schema()
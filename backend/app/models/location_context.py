@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class LocationContext:
-    latitude: str
-    longitude: str
\ No newline at end of file
+    latitude: float
+    longitude: float
\ No newline at end of file
@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class UserRequest(BaseModel):
     request: str
     longitude: str
-    latitude: str
\ No newline at end of file
+    latitude: str
+
+    model_config = ConfigDict(frozen=True, extra='forbid')
@@ -1,18 +1,120 @@
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 
+from backend.app.core.clock import now_iso
+from backend.app.core.cost_protection import cost_protection
+from backend.app.dependencies import get_analysis_service, get_calling_service, get_hospital_service
 from backend.app.models.accident_report import AccidentReport
+from backend.app.models.emergency_analysis_request import EmergencyAnalysisRequest
+from backend.app.models.emergency_report_request import EmergencyReportRequest
 from backend.app.models.user_request import UserRequest
+from backend.app.service.analysis_service import EmergencyAnalysisService
+from backend.app.service.calling_service import CallingService
+from backend.app.service.hospital_service import HospitalSearchService, get_demo_hospitals
 from backend.app.service.run_accident_response_agent import handle_question
 
 router = APIRouter()
 
+# Canned demo payloads returned before any quota or upstream work when
+# DEMO_MODE is on: demo traffic never touches OpenAI, Maps, or Twilio.
+DEMO_RESPONSES = {
+    "analyze": {
+        "emergency_type": "vehicle_accident",
+        "severity": "moderate",
+        "scenario_type": "vehicle-accident",
+        "location": "Ananta Tech Park, Bangalore",
+        "first_aid_tips": "Do not move the injured unless in danger, stop any bleeding, keep them warm.",
+        "recommended_actions": ["Seek medical attention promptly", "Monitor the person's condition"],
+        "details": "Demo accident: bike collided with a car at the traffic signal.",
+    },
+}
+
+# Constant responses serialized once at import; the handlers just hand
+# bytes to the socket, which keeps liveness probes off the serializer.
+_ROOT_BYTES = orjson.dumps({"message": "This is your entry into medi aid"})
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+_TEST_BYTES = orjson.dumps({"status": "ok", "message": "MediAid backend is reachable"})
+
 @router.get("/")
 async def root():
-    return {"message": "This is your entry into medi aid"}
+    return Response(_ROOT_BYTES, media_type="application/json")
+
+@router.get("/health")
+async def health():
+    return Response(_HEALTH_BYTES, media_type="application/json")
+
+@router.get("/test")
+async def test():
+    return Response(_TEST_BYTES, media_type="application/json")
+
+@router.get("/status")
+async def status():
+    # demo_mode and timestamp vary, so this one stays dynamic.
+    return {
+        "status": "running",
+        "demo_mode": cost_protection.is_demo_mode(),
+        "timestamp": now_iso(),
+    }
+
+@router.post("/emergency/analyze")
+async def analyze_emergency(
+    payload: EmergencyAnalysisRequest,
+    analysis_service: EmergencyAnalysisService = Depends(get_analysis_service),
+):
+    if cost_protection.is_demo_mode():
+        response = dict(DEMO_RESPONSES["analyze"])
+        response["performance"] = {"response_time_ms": 0, "demo": True}
+        return response
+    try:
+        return await analysis_service.analyze_emergency(
+            payload.message,
+            location=payload.location,
+            scenario_type=payload.scenario_type,
+            force_new_analysis=payload.force_new_analysis,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+@router.get("/emergency/hospitals")
+async def emergency_hospitals(
+    latitude: float,
+    longitude: float,
+    radius: int = 5000,
+    hospital_service: HospitalSearchService = Depends(get_hospital_service),
+):
+    if cost_protection.is_demo_mode():
+        hospitals = get_demo_hospitals(latitude, longitude)
+        return {"hospitals": hospitals, "count": len(hospitals)}
+    try:
+        hospitals = await hospital_service.find_nearby_hospitals(latitude, longitude, radius)
+        return {"hospitals": hospitals, "count": len(hospitals)}
+    except ValueError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+@router.post("/emergency/report")
+async def emergency_report(
+    payload: EmergencyReportRequest,
+    calling_service: CallingService = Depends(get_calling_service),
+):
+    try:
+        return await calling_service.send_emergency_report(payload.message, payload.location)
+    except ValueError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+@router.get("/analytics/usage")
+async def usage_analytics():
+    usage_data = cost_protection.get_usage_report()
+    return {
+        "analytics": usage_data,
+        "summary": {"total_requests": usage_data["total_requests"]},
+    }
 
-@router.post("/ask", response_model=AccidentReport)
-async def ask_question(payload: UserRequest):
+@router.post("/ask", response_model=None)
+async def ask_question(payload: UserRequest) -> AccidentReport:
     try:
+        # handle_question already validated the agent output into an
+        # AccidentReport; return that instance as-is so FastAPI only
+        # serializes it instead of validating the same data a second time.
         return await handle_question(payload)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
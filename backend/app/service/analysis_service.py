@@ -0,0 +1,299 @@
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from types import MappingProxyType
+
+import httpx
+import orjson
+
+from backend.app.core.cache import SharedTTLCache
+from backend.app.core.clock import now_iso
+from backend.app.core.config import settings
+from backend.app.core.cost_protection import cost_protection
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_SECONDS = 3600
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+OPENAI_MODEL = "gpt-4o-mini"
+
+ANALYSIS_SYSTEM_PROMPT = ("You are an emergency first-aid assistant. "
+                          "Reply with a JSON object containing first_aid_tips (string), "
+                          "recommended_actions (list of strings), and details (string).")
+
+# Fingerprint of everything that determines an analysis result; baked into
+# every cache key so changing the model or prompt rolls the namespace
+# instead of serving stale entries from a persistent or shared store.
+MODEL_HASH = hashlib.sha1((OPENAI_MODEL + ANALYSIS_SYSTEM_PROMPT).encode()).hexdigest()[:8]
+
+# Canonical message per canned scenario; these are analyzed once at
+# startup so runtime requests for them are a cache fetch.
+SCENARIO_TEMPLATES = {
+    "cardiac-arrest": "A person has collapsed, is unresponsive and not breathing.",
+    "choking": "A person is choking on food and cannot breathe or speak.",
+    "severe-bleeding": "A person has a deep cut and is bleeding heavily.",
+    "vehicle-accident": "A motor accident occurred; the rider fell and has a deep cut on his leg.",
+}
+
+PRECOMPUTED_TTL_SECONDS = 10 ** 9
+
+# Cap on concurrent OpenAI calls per worker; bursts beyond this queue
+# instead of piling connections onto the API.
+MAX_CONCURRENT_AI_CALLS = 8
+
+# Keyword tables compiled once into a single alternation so one linear
+# regex pass over the message yields both the emergency type and the
+# severity, instead of eight sequential substring scans.
+_EMERGENCY_KEYWORDS = {
+    "cardiac": ("heart attack", "cardiac", "chest pain", "collapsed", "not breathing"),
+    "choking": ("choking", "can't breathe", "airway", "swallowed"),
+    "bleeding": ("bleeding", "blood", "deep cut", "laceration", "wound"),
+    "burn": ("burn", "burned", "scalded", "fire"),
+    "fracture": ("fracture", "broken bone", "broken leg", "broken arm"),
+    "vehicle_accident": ("car accident", "bike accident", "collision", "crashed", "run over", "motor accident"),
+}
+
+_CRITICAL_KEYWORDS = frozenset({"unconscious", "not breathing", "heavy bleeding", "bleeding heavily",
+                                "severe", "unresponsive", "cardiac", "major trauma"})
+_MODERATE_KEYWORDS = frozenset({"deep cut", "fracture", "broken", "burn", "in pain"})
+
+# Fallback guidance, built once; read-only views so a handler can't
+# mutate the shared tables by accident.
+_FALLBACK_TIPS = MappingProxyType({
+    "cardiac": "Call for help, start chest compressions, use an AED if available.",
+    "choking": "Give 5 back blows, then 5 abdominal thrusts, repeat until the object clears.",
+    "bleeding": "Apply firm direct pressure with a clean cloth and elevate the wound.",
+    "burn": "Cool the burn under running water for 20 minutes, cover loosely.",
+    "fracture": "Immobilize the limb, apply a cold pack, do not try to realign.",
+    "vehicle_accident": "Do not move the injured unless in danger, stop any bleeding, keep them warm.",
+})
+_DEFAULT_TIP = "Keep the person calm and still until help arrives."
+
+_FALLBACK_ACTIONS = MappingProxyType({
+    "critical": ("Call emergency services immediately", "Do not leave the person alone", "Prepare for CPR"),
+    "moderate": ("Seek medical attention promptly", "Monitor the person's condition"),
+    "minor": ("Administer basic first aid", "Visit a clinic if symptoms worsen"),
+})
+_DEFAULT_ACTIONS = ("Monitor the situation",)
+
+_KEYWORD_CATEGORY = {
+    keyword: category
+    for category, keywords in _EMERGENCY_KEYWORDS.items()
+    for keyword in keywords
+}
+_CATEGORY_PRIORITY = tuple(_EMERGENCY_KEYWORDS)
+
+# Single-word keywords double as an O(1) dispatch table: when one of the
+# first few tokens names the emergency outright ("choking", "burn"),
+# category resolution skips the priority walk over the match set.
+_FIRST_TOKEN_MAP = {
+    keyword: category
+    for category, keywords in _EMERGENCY_KEYWORDS.items()
+    for keyword in keywords
+    if " " not in keyword
+}
+
+_ALL_KEYWORDS = sorted(
+    set(_KEYWORD_CATEGORY) | _CRITICAL_KEYWORDS | _MODERATE_KEYWORDS,
+    key=len, reverse=True,  # longest-first so "heavy bleeding" beats "bleeding"
+)
+_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in _ALL_KEYWORDS))
+
+
+def _scan_message(text: str) -> tuple[str, str]:
+    """Classify emergency type and severity in one pass over lowered text."""
+    matches = set(_KEYWORD_RE.findall(text))
+    emergency_type = None
+    for token in text.split()[:4]:
+        emergency_type = _FIRST_TOKEN_MAP.get(token.strip(".,!?"))
+        if emergency_type:
+            break
+    if emergency_type is None:
+        emergency_type = "general"
+        for category in _CATEGORY_PRIORITY:
+            if any(_KEYWORD_CATEGORY.get(match) == category for match in matches):
+                emergency_type = category
+                break
+    if matches & _CRITICAL_KEYWORDS:
+        severity = "critical"
+    elif matches & _MODERATE_KEYWORDS:
+        severity = "moderate"
+    else:
+        severity = "minor"
+    return emergency_type, severity
+
+
+class EmergencyAnalysisService:
+    """Classifies an emergency message and produces first-aid guidance.
+
+    Analyses are memoized by a hash of the normalized message plus the
+    scenario type, so repeat reports of the same scenario skip the OpenAI
+    round-trip and its quota charge.
+    """
+
+    def __init__(self):
+        self._cache = SharedTTLCache(maxsize=512, ttl=CACHE_TTL_SECONDS,
+                                     redis_url=settings.REDIS_URL)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._ai_semaphore = asyncio.Semaphore(MAX_CONCURRENT_AI_CALLS)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create one keep-alive client for all OpenAI calls.
+
+        A fresh client per request would pay a full TCP+TLS handshake to
+        api.openai.com every time; this one is built on first use and
+        reused for the life of the app. With h2 installed, concurrent
+        calls multiplex over a single HTTP/2 connection instead of
+        queueing for sockets.
+        """
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            try:
+                self._client = httpx.AsyncClient(http2=True, timeout=8.0, limits=limits)
+            except ImportError:  # h2 extra not installed; HTTP/1.1 keep-alive
+                self._client = httpx.AsyncClient(timeout=8.0, limits=limits)
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    @staticmethod
+    def _cache_key(message: str, scenario_type: str) -> str:
+        # blake2b is faster than sha256 and 8 bytes is plenty for a cache
+        # namespace; stability across restarts comes from hashing content,
+        # never from PYTHONHASHSEED-randomized hash().
+        normalized = " ".join(message.lower().split())
+        digest = hashlib.blake2b(f"{normalized}|{scenario_type}".encode(), digest_size=8)
+        return f"v{MODEL_HASH}:{digest.hexdigest()}"
+
+    async def analyze_emergency(self, message: str, location=None,
+                                scenario_type: str = "custom-emergency",
+                                force_new_analysis: bool = False) -> dict:
+        # Canned scenarios were analyzed at startup; answer from the
+        # precomputed entry no matter how the caller phrased the message.
+        if scenario_type in SCENARIO_TEMPLATES and not force_new_analysis:
+            precomputed_key = self._cache_key(SCENARIO_TEMPLATES[scenario_type], scenario_type)
+            cached = await self._cache.get(precomputed_key)
+            if cached is not None:
+                result = dict(cached)
+                result["performance"] = {"cached": True, "response_time_ms": 0}
+                return result
+
+        key = self._cache_key(message, scenario_type)
+        if not force_new_analysis:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                result = dict(cached)
+                result["performance"] = {"cached": True, "response_time_ms": 0}
+                return result
+            # Single-flight: concurrent identical requests await the first
+            # one's Future instead of each starting their own OpenAI call.
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                return await inflight
+            future = asyncio.get_event_loop().create_future()
+            self._inflight[key] = future
+            try:
+                result = await self._analyze(message, location, scenario_type, key)
+                future.set_result(result)
+                return result
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                del self._inflight[key]
+
+        return await self._analyze(message, location, scenario_type, key)
+
+    async def _analyze(self, message: str, location, scenario_type: str, key: str) -> dict:
+        start = time.monotonic()
+        # Lower once and scan once for both answers.
+        emergency_type, severity = _scan_message(message.lower())
+        # Concurrent analyses already overlap on the event loop (bounded
+        # by _ai_semaphore); each one posts its own chat completion.
+        ai_response = await self._ai_analysis(message, emergency_type, severity)
+
+        # Bind each field once; the fallbacks are only materialized when
+        # the AI response is actually missing them, instead of being
+        # built eagerly as .get() default arguments.
+        tips = ai_response.get("first_aid_tips") or self._fallback_tips(emergency_type)
+        actions = ai_response.get("recommended_actions") or self._fallback_actions(severity)
+        details = ai_response.get("details") or message
+        result = {
+            "emergency_type": emergency_type,
+            "severity": severity,
+            "scenario_type": scenario_type,
+            "location": location,
+            "first_aid_tips": tips,
+            "recommended_actions": actions,
+            "details": details,
+            "timestamp": now_iso(),
+        }
+        await self._cache.set(key, result)
+        response_time = int((time.monotonic() - start) * 1000)
+        return {**result, "performance": {"cached": False, "response_time_ms": response_time}}
+
+    async def warm_cache(self) -> None:
+        """Precompute the canned scenarios so runtime hits are a dict fetch."""
+        for scenario_type, message in SCENARIO_TEMPLATES.items():
+            key = self._cache_key(message, scenario_type)
+            if await self._cache.contains(key):
+                continue
+            try:
+                await self._analyze(message, None, scenario_type, key)
+            except Exception as e:
+                logger.error("Cache warmup failed for %s: %s", scenario_type, e)
+                continue
+            await self._cache.set(key, await self._cache.get(key), ttl=PRECOMPUTED_TTL_SECONDS)
+
+    def _classify_emergency(self, message: str, message_lower: str | None = None) -> str:
+        return _scan_message(message_lower or message.lower())[0]
+
+    def _assess_severity(self, message: str, message_lower: str | None = None) -> str:
+        return _scan_message(message_lower or message.lower())[1]
+
+    def _fallback_tips(self, emergency_type: str) -> str:
+        return _FALLBACK_TIPS.get(emergency_type, _DEFAULT_TIP)
+
+    def _fallback_actions(self, severity: str) -> list[str]:
+        return list(_FALLBACK_ACTIONS.get(severity, _DEFAULT_ACTIONS))
+
+    async def _ai_analysis(self, message: str, emergency_type: str, severity: str) -> dict:
+        if cost_protection.is_demo_mode():
+            return {}
+        if not cost_protection.charge("openai"):
+            logger.warning("OpenAI quota exhausted, using fallback analysis")
+            return {}
+        payload = {
+            "model": OPENAI_MODEL,
+            "messages": [
+                {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": f"Emergency type: {emergency_type}. Severity: {severity}. Report: {message}"},
+            ],
+            "response_format": {"type": "json_object"},
+        }
+        try:
+            client = self._get_client()
+            async with self._ai_semaphore:
+                response = await client.post(
+                    OPENAI_CHAT_URL,
+                    content=orjson.dumps(payload),
+                    headers={
+                        "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
+                        "Content-Type": "application/json",
+                    },
+                )
+            response.raise_for_status()
+            # orjson does both decode passes: the completion envelope,
+            # then the stringified JSON in content.
+            body = orjson.loads(response.content)
+            return orjson.loads(body["choices"][0]["message"]["content"])
+        except Exception as e:
+            logger.error("AI analysis failed: %s", e)
+            return {}
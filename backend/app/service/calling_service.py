@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import os
+from functools import lru_cache
+from string import Template
+from xml.sax.saxutils import escape
+
+from twilio.http.http_client import TwilioHttpClient
+from twilio.rest import Client
+
+from backend.app.core.circuit_breaker import CircuitBreaker
+from backend.app.core.config import settings
+from backend.app.core.cost_protection import cost_protection
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_twilio_client() -> Client:
+    """Process-wide Twilio client over one keep-alive requests.Session.
+
+    Every calls.create() reuses the same warm TLS connection to
+    api.twilio.com instead of paying a fresh handshake per emergency call.
+    """
+    return Client(
+        settings.ACCOUNT_SID,
+        settings.AUTH_TOKEN,
+        http_client=TwilioHttpClient(pool_connections=True, max_retries=1),
+    )
+
+# Recipients notified for every emergency report; numbers come from env so
+# demos can point them anywhere.
+RECIPIENTS = {
+    "emergency_dispatch": "EMERGENCY_DISPATCH_NUMBER",
+    "hospital": "HOSPITAL_NUMBER",
+    "emergency_coordinator": "EMERGENCY_COORDINATOR_NUMBER",
+}
+
+# Generous enough for a cold TLS handshake on the first report after
+# startup. Cancelling the wait does NOT abort the underlying SDK call —
+# it runs in a worker thread — so a timeout means "outcome unknown",
+# not "call not placed".
+NOTIFY_TIMEOUT_SECONDS = 10.0
+
+# Parsed once; substitution is one dict lookup per call, and escaping
+# keeps a message containing & or < from producing TwiML that Twilio
+# rejects after a full round-trip.
+TWIML_SAY = Template("<Response><Say>$message</Say></Response>")
+
+
+def render_twiml(message: str) -> str:
+    return TWIML_SAY.substitute(message=escape(message))
+
+
+class CallingService:
+    """Places Twilio voice calls for emergency notifications."""
+
+    def __init__(self):
+        self._client = get_twilio_client()
+        self._breaker = CircuitBreaker(fail_max=5, reset_timeout=30.0)
+
+    async def _call(self, phone_number: str, message: str) -> str:
+        if cost_protection.is_demo_mode():
+            logger.info("Demo mode: skipping call to %s", phone_number)
+            return "demo"
+        if not self._breaker.allow():
+            logger.warning("Twilio circuit open; skipping call to %s", phone_number)
+            return "degraded"
+        if not cost_protection.charge("twilio"):
+            raise ValueError("Daily Twilio quota exhausted")
+        try:
+            call = await asyncio.to_thread(
+                self._client.calls.create,
+                to=phone_number,
+                from_=settings.TWILIO_PHONE_NUMBER,
+                twiml=render_twiml(message),
+            )
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return call.sid
+
+    async def call_hospital(self, phone_number: str, message: str) -> str:
+        return await self._call(phone_number, message)
+
+    async def _notify(self, recipient: str, message: str) -> dict:
+        phone_number = os.getenv(RECIPIENTS[recipient], "")
+        if not phone_number:
+            return {"recipient": recipient, "status": "skipped", "reason": "no number configured"}
+        try:
+            sid = await asyncio.wait_for(
+                self._call(phone_number, message), timeout=NOTIFY_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            # The threaded Twilio call keeps running past the wait and
+            # the quota was already charged; say so instead of implying
+            # no call went out, so nobody blindly re-dispatches.
+            return {"recipient": recipient, "status": "unknown",
+                    "reason": "timed out waiting for Twilio; the call may still have been placed"}
+        return {"recipient": recipient, "status": "notified", "sid": sid}
+
+    async def send_emergency_report(self, message: str, location: str = None) -> dict:
+        """Notify all recipients concurrently.
+
+        The three calls overlap via gather, so report latency is the
+        slowest single notification instead of their sum, and one slow or
+        failing recipient doesn't block the others.
+        """
+        text = f"Emergency report: {message}."
+        if location:
+            text += f" Location: {location}."
+        results = await asyncio.gather(
+            *(self._notify(recipient, text) for recipient in RECIPIENTS),
+            return_exceptions=True,
+        )
+        notified, failed = [], []
+        for recipient, result in zip(RECIPIENTS, results):
+            if isinstance(result, Exception):
+                logger.error("Notification to %s failed: %s", recipient, result)
+                failed.append({"recipient": recipient, "error": str(result)})
+            else:
+                notified.append(result)
+        return {"notified": notified, "failed": failed}
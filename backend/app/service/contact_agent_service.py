@@ -1,30 +1,38 @@
+import string
+
 from agents import Runner
 from backend.app.agents.contact_agent import contact_agent
 from backend.app.models.hospital_info import HospitalInfo
 
+# Built once at import; substitute() walks the precompiled template pieces
+# instead of re-formatting a large f-string per call, and hospital text
+# containing braces can't break the formatting.
+_PROMPT = string.Template("""
+    You are a virtual assistant acting as a first responder.
+    Call the hospital below and inform them about the incoming emergency.
+
+    Hospital Information:
+    - Name: $name
+    - Address: $address
+    - Phone Number: $phone
+
+    Instructions:
+    1. Craft a concise message for the hospital, including accident type, location, and details.
+    2. Ensure the output is clear, professional, and actionable.
+    """)
+
 async def contact_agent_service(payload: HospitalInfo) -> str:
     try:
         result = await Runner.run(
-            contact_agent, 
-            prompt=f"""
-            You are a virtual assistant acting as a first responder. 
-            Based on the following accident details, find the **best hospital** nearby.
-
-            Accident Details:
-            - Accident Type: {payload.accident_type}
-            - Location: {payload.location}
-            - Description: {payload.details}
-
-            Instructions:
-            1. Use any available data to select the most suitable hospital.
-            2. Include the hospital's name, address, and phone number (if available).
-            3. Craft a concise message for the hospital, including accident type, location, and details.
-            4. Ensure the output is clear, professional, and actionable.
-            """
+            contact_agent,
+            _PROMPT.substitute(
+                name=payload.name,
+                address=payload.address,
+                phone=payload.phone_number,
+            ),
         )
 
         return "success"
-    
+
     except Exception as e:
         raise Exception(f'contact_agent_service threw an exception {e}')
-    
\ No newline at end of file
@@ -1,23 +1,54 @@
+import asyncio
+import os
+
 from agents import Runner
 from backend.app.agents.hospital_finder_agent import hospital_finder_agent
+from backend.app.core.cache import TTLCache
 from backend.app.models.accident_report import AccidentReport
 from backend.app.models.hospital_info import HospitalInfo
 from backend.app.models.location_context import LocationContext
 from backend.app.service.contact_agent_service import contact_agent_service
 
+# Bound the finder agent so a hung LLM/tool call can't pin the coroutine.
+AGENT_TIMEOUT_SECONDS = float(os.getenv("AGENT_TIMEOUT_S", "15"))
+
+# Lookups within the same ~100m bucket and accident type reuse the memoized
+# answer, skipping both the LLM call and the Google Maps request. Only the
+# lookup is memoized — the contact call below runs for every report.
+_hospital_cache = TTLCache(maxsize=512, ttl=3600)
+
+def _cache_key(payload: AccidentReport, location_context: LocationContext):
+    return (
+        round(location_context.latitude, 3),
+        round(location_context.longitude, 3),
+        payload.accident_type,
+    )
+
 async def hospital_search_service(payload: AccidentReport, location_context: LocationContext) -> HospitalInfo:
     try:
-        result =await Runner.run(
-            hospital_finder_agent, 
-            context=location_context,
-            input=f'''
+        key = _cache_key(payload, location_context)
+        hospital_info = _hospital_cache.get(key)
+        if hospital_info is None:
+            result = await asyncio.wait_for(
+                Runner.run(
+                    hospital_finder_agent,
+                    context=location_context,
+                    input=f'''
             "You are a first responder at the scene of a road accident. "
             "The patient has {payload.details} as a {payload.accident_type} accident. "
             "Find the nearest hospital to the given location latitude={location_context.latitude}, longitude={location_context.longitude} and return only a JSON object with: "
             "name, address, rating, user_ratings_total, and phone_number."
-            ''')
-        contact_agent_service(result.final_output_as(AccidentReport))
-        return result.final_output_as(AccidentReport)
+            '''),
+                timeout=AGENT_TIMEOUT_SECONDS)
+            # final_output_as() is only a typing cast, so parse the agent's
+            # JSON text into a real HospitalInfo before handing it on.
+            hospital_info = HospitalInfo.model_validate_json(result.final_output)
+            _hospital_cache.set(key, hospital_info)
+        # The contact call is an emergency-notification side effect, not
+        # part of the lookup: it must go out for every report, cache hit
+        # or not (the old early return silently skipped it).
+        await contact_agent_service(hospital_info)
+        return hospital_info
     
     except Exception as e:
         raise Exception(f'hospital_search_service threw an exception {e}')
@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import time
+from functools import lru_cache
+
+import googlemaps
+import numpy as np
+import requests.adapters
+
+from backend.app.core.cache import TTLCache
+from backend.app.core.circuit_breaker import CircuitBreaker
+from backend.app.core.config import settings
+from backend.app.core.cost_protection import cost_protection
+from backend.app.tools.rank import haversine_km
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1)
+def get_gmaps_client() -> googlemaps.Client:
+    """Process-wide Google Maps client with a pre-sized keep-alive pool.
+
+    One client means one requests.Session, so concurrent lookups reuse
+    warm TLS connections instead of churning through new handshakes.
+    """
+    client = googlemaps.Client(settings.GOOGLE_MAPS_API_KEY, requests_kwargs={"timeout": 5})
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=requests.adapters.Retry(total=2, backoff_factor=0.1),
+    )
+    client.session.mount("https://", adapter)
+    return client
+
+# Nearby users share results, so answers stay fresh for an hour per
+# ~100m coordinate bucket.
+CACHE_TTL_SECONDS = 3600
+
+# Demo hospitals: the invariant fields are built once at import as
+# (dlat, dlon, fields) tuples; a call is five shallow dict copies with
+# the caller's coordinates offset in, not a fresh literal per field.
+_DEMO_HOSPITAL_TEMPLATE = (
+    (0.010, 0.010, {"name": "City General Hospital", "address": "100 Demo Main Road",
+                    "rating": 4.5, "user_ratings_total": 1200,
+                    "phone_number": "+1 555 010 0001", "distance_km": 1.2}),
+    (-0.008, 0.012, {"name": "St. Mary's Medical Center", "address": "22 Demo Cross Street",
+                     "rating": 4.3, "user_ratings_total": 860,
+                     "phone_number": "+1 555 010 0002", "distance_km": 1.5}),
+    (0.015, -0.006, {"name": "Riverside Emergency Hospital", "address": "7 Demo River Lane",
+                     "rating": 4.1, "user_ratings_total": 540,
+                     "phone_number": "+1 555 010 0003", "distance_km": 1.9}),
+    (-0.012, -0.011, {"name": "Sunrise Community Clinic", "address": "45 Demo Park Avenue",
+                      "rating": 3.9, "user_ratings_total": 310,
+                      "phone_number": "+1 555 010 0004", "distance_km": 2.1}),
+    (0.004, 0.018, {"name": "Metro Trauma Center", "address": "310 Demo Ring Road",
+                    "rating": 4.7, "user_ratings_total": 2050,
+                    "phone_number": "+1 555 010 0005", "distance_km": 2.4}),
+)
+
+# Nearest-first ordering is query-invariant because the offsets are
+# fixed, so rank once at import with the squared-offset proxy (the
+# unit-sphere chord ordering for small deltas). The demo path then does
+# zero distance math per request — no haversine, no sqrt.
+_DEMO_HOSPITAL_TEMPLATE = tuple(
+    sorted(_DEMO_HOSPITAL_TEMPLATE, key=lambda t: t[0] * t[0] + t[1] * t[1])
+)
+
+
+@lru_cache(maxsize=256)
+def _build_demo_hospitals(lat_r: float, lon_r: float) -> tuple[dict, ...]:
+    return tuple(
+        {**fields, "latitude": lat_r + dlat, "longitude": lon_r + dlon}
+        for dlat, dlon, fields in _DEMO_HOSPITAL_TEMPLATE
+    )
+
+
+def get_demo_hospitals(latitude: float, longitude: float) -> list[dict]:
+    """Canned hospital list centered on the caller's coordinates.
+
+    Memoized per ~100m bucket: a demo-mode request storm from one area
+    reuses the same read-only dicts instead of rebuilding them per call.
+    """
+    return list(_build_demo_hospitals(round(latitude, 3), round(longitude, 3)))
+
+
+class HospitalSearchService:
+    """Looks up hospitals near a location through Google Maps Places.
+
+    Results are cached per rounded (lat, lon, radius) bucket: repeat
+    queries from the same area skip both the outbound Maps call and the
+    cost-protection charge.
+    """
+
+    def __init__(self):
+        self._gmaps = get_gmaps_client()
+        self._cache = TTLCache(maxsize=512, ttl=CACHE_TTL_SECONDS)
+        self._inflight = {}
+        self._breaker = CircuitBreaker(fail_max=5, reset_timeout=30.0)
+
+    @staticmethod
+    def _cache_key(latitude: float, longitude: float, radius: int):
+        # 3 decimal places is ~110m, on the order of a Places radius bucket.
+        return (round(latitude, 3), round(longitude, 3), radius)
+
+    async def find_nearby_hospitals(self, latitude: float, longitude: float, radius: int = 5000) -> list[dict]:
+        key = self._cache_key(latitude, longitude, radius)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        # During a Maps outage, fail fast to the canned list instead of
+        # spending the full connect+timeout budget on every request.
+        if not self._breaker.allow():
+            logger.warning("Google Maps circuit open; serving demo hospitals")
+            return get_demo_hospitals(latitude, longitude)
+
+        # Single-flight: a burst of identical lookups shares one Maps call.
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+        future = asyncio.get_event_loop().create_future()
+        self._inflight[key] = future
+        try:
+            # The googlemaps SDK blocks on requests; run the search in a
+            # worker thread so the event loop keeps serving other requests.
+            hospitals = await asyncio.to_thread(self._search, latitude, longitude, radius)
+            hospitals = await self._attach_phone_numbers(hospitals)
+            self._cache.set(key, hospitals)
+            self._breaker.record_success()
+            future.set_result(hospitals)
+            return hospitals
+        except Exception as e:
+            self._breaker.record_failure()
+            future.set_exception(e)
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def iter_nearby_hospitals(self, latitude: float, longitude: float, radius: int = 5000):
+        """Yield hospitals nearest-first, on demand.
+
+        Callers that only need the first reachable hospital (e.g. dialing
+        down the list until one answers) can break out early instead of
+        materializing and post-processing the full result list.
+        """
+        for hospital in await self.find_nearby_hospitals(latitude, longitude, radius):
+            yield hospital
+
+    def _search(self, latitude: float, longitude: float, radius: int) -> list[dict]:
+        if not cost_protection.charge("google_maps"):
+            raise ValueError("Daily Google Maps quota exhausted")
+
+        places = self._gmaps.places_nearby(
+            location=(latitude, longitude),
+            radius=radius,
+            type="hospital",
+        ).get("results", [])
+
+        hospitals = []
+        for place in places:
+            # No place_id means no Details lookup and no way to dedupe;
+            # skip rather than carry a dead entry downstream.
+            if not place.get("place_id"):
+                continue
+            location = place.get("geometry", {}).get("location", {})
+            hospitals.append({
+                "name": place.get("name", "Unknown"),
+                "address": place.get("vicinity", "Unknown"),
+                "rating": float(place.get("rating", 0)),
+                "user_ratings_total": int(place.get("user_ratings_total", 0)),
+                "latitude": location.get("lat"),
+                "longitude": location.get("lng"),
+                "place_id": place["place_id"],
+                "phone_number": "N/A",
+            })
+        return self._filter_by_distance(hospitals, latitude, longitude, radius / 1000.0)
+
+    async def _attach_phone_numbers(self, hospitals: list[dict]) -> list[dict]:
+        """Fetch phone numbers for the closest results via Place Details.
+
+        Nearby Search never returns formatted_phone_number, so without
+        this every entry degrades to "N/A". The per-hospital Details
+        calls run concurrently (bounded by a semaphore) so the extra
+        round-trips cost ~1 RTT instead of one per hospital.
+        """
+        semaphore = asyncio.Semaphore(5)
+
+        async def fetch(place_id: str):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._gmaps.place, place_id=place_id, fields=["formatted_phone_number"]
+                )
+
+        # Deduplicate ids and only enrich the top results.
+        place_ids = list(dict.fromkeys(
+            h["place_id"] for h in hospitals[:5] if h.get("place_id")
+        ))
+        details = await asyncio.gather(*(fetch(pid) for pid in place_ids), return_exceptions=True)
+        phones = {}
+        for place_id, detail in zip(place_ids, details):
+            if isinstance(detail, Exception):
+                logger.warning("Place details lookup failed for %s: %s", place_id, detail)
+                continue
+            phone = detail.get("result", {}).get("formatted_phone_number")
+            if phone:
+                phones[place_id] = phone
+        for hospital in hospitals:
+            hospital["phone_number"] = phones.get(hospital.get("place_id"), hospital["phone_number"])
+        return hospitals
+
+    # Above this many candidates, rank with a cheap flat-earth proxy first
+    # and reserve the exact haversine for the nearest survivors.
+    _EXACT_DISTANCE_LIMIT = 32
+
+    @classmethod
+    def _filter_by_distance(cls, hospitals: list[dict], latitude: float, longitude: float,
+                            radius_km: float) -> list[dict]:
+        """Drop results outside the radius and sort by true distance.
+
+        Coordinates go into two contiguous float arrays (SoA) so the
+        haversine runs once, vectorized, instead of per-dict trig in a
+        Python loop; each surviving entry gets its distance_km attached.
+        For large candidate sets a squared equirectangular proxy (ordering
+        agrees with haversine at city scale) prunes to the nearest K
+        before the exact trig runs.
+        """
+        if not hospitals:
+            return hospitals
+        lats = np.asarray([h["latitude"] or latitude for h in hospitals], dtype=np.float64)
+        lons = np.asarray([h["longitude"] or longitude for h in hospitals], dtype=np.float64)
+        if len(hospitals) > cls._EXACT_DISTANCE_LIMIT:
+            dx = (lats - latitude) * np.cos(np.radians(latitude))
+            dy = lons - longitude
+            nearest = np.argpartition(dx * dx + dy * dy, cls._EXACT_DISTANCE_LIMIT)
+            nearest = nearest[:cls._EXACT_DISTANCE_LIMIT]
+            hospitals = [hospitals[i] for i in nearest]
+            lats = lats[nearest]
+            lons = lons[nearest]
+        distance = haversine_km(lats, lons, latitude, longitude)
+        order = np.argsort(distance)
+        kept = []
+        for i in order:
+            if distance[i] > radius_km:
+                break
+            hospital = dict(hospitals[i])
+            hospital["distance_km"] = round(float(distance[i]), 2)
+            kept.append(hospital)
+        return kept
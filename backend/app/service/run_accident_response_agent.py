@@ -1,4 +1,6 @@
+import asyncio
 import json
+import os
 from agents import Runner
 from backend.app.agents.accident_response_agent import accident_response_agent
 from backend.app.models.accident_report import AccidentReport
@@ -6,23 +8,41 @@ from backend.app.models.location_context import LocationContext
 from backend.app.models.user_request import UserRequest
 from backend.app.service.hospital_search_service import hospital_search_service
 
+# A hung LLM call would otherwise pin this coroutine (and its pooled
+# connection) forever; bound it so the request fails fast instead.
+AGENT_TIMEOUT_SECONDS = float(os.getenv("AGENT_TIMEOUT_S", "15"))
+
 async def handle_question(payload: UserRequest) -> AccidentReport:
     try:
-        result = await Runner.run(
-            accident_response_agent, 
-            f"{payload.request} at longitude {payload.longitude} and latitude {payload.latitude}")
-        accident_report = result.final_output_as(AccidentReport)
-        # pass to hospital search
-        hospital_search_service(
-            accident_report, 
+        result = await asyncio.wait_for(
+            Runner.run(
+                accident_response_agent,
+                f"{payload.request} at longitude {payload.longitude} and latitude {payload.latitude}"),
+            timeout=AGENT_TIMEOUT_SECONDS)
+        # final_output_as() is only a typing cast in the agents SDK — the
+        # agent has no output_type, so final_output is raw JSON text.
+        # Parse it here so /ask really returns a validated AccidentReport.
+        accident_report = AccidentReport.model_validate_json(result.final_output)
+        # pass to hospital search; the bare call used to build a coroutine
+        # and drop it, so the lookup never actually ran.
+        await hospital_search_service(
+            accident_report,
             location_context=LocationContext(
-                longitude=payload.longitude, 
-                latitude=payload.latitude
+                longitude=float(payload.longitude),
+                latitude=float(payload.latitude)
             )
-        ) 
-        
+        )
+
         return accident_report
-    
+
     except Exception as e:
         raise Exception(f'handle_question threw an exception {e}')
-    
\ No newline at end of file
+
+async def handle_questions(payloads: list[UserRequest]) -> list[AccidentReport]:
+    """Handle a batch of reports concurrently.
+
+    Overlapping reports share one event loop, so their prompts reach
+    Ollama together and get merged into the same iteration-level batch
+    (OLLAMA_NUM_PARALLEL) instead of queueing behind each other.
+    """
+    return await asyncio.gather(*[handle_question(payload) for payload in payloads])
@@ -1,21 +1,40 @@
-import os
+import asyncio
+from functools import lru_cache
+
 from dotenv import load_dotenv
 from agents import function_tool
-from twilio.rest import Client
+import httpx
+from backend.app.core.config import settings
+from backend.app.service.calling_service import render_twiml
 
 load_dotenv()
 
-client = Client(os.getenv("ACCOUNT_SID"), os.getenv("AUTH_TOKEN"))
+_CALLS_URL = f"https://api.twilio.com/2010-04-01/Accounts/{settings.ACCOUNT_SID}/Calls.json"
+
+@lru_cache(maxsize=1)
+def _client() -> httpx.AsyncClient:
+    """One async client, built on first call rather than at import.
+
+    Calls go straight to the Twilio REST endpoint on warm keep-alive
+    connections — no worker thread, no blocking SDK in the event loop —
+    and importing this module (workers, test collection) costs nothing.
+    """
+    return httpx.AsyncClient(
+        auth=(settings.ACCOUNT_SID, settings.AUTH_TOKEN),
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=10.0,
+    )
 
 @function_tool
-def calling_tool(hospital_number:str ,message:str) -> None:
+async def calling_tool(hospital_number:str ,message:str) -> None:
     """Dials one or more phone numbers from a Twilio phone number."""
-    client.calls.create(
-        to=hospital_number,
-        from_=os.getenv("TWILIO_PHONE_NUMBER"),
-        twiml=f"<Response><Say>{message}</Say></Response>",
-    )
+    response = await _client().post(_CALLS_URL, data={
+        "To": hospital_number,
+        "From": settings.TWILIO_PHONE_NUMBER,
+        "Twiml": render_twiml(message),
+    })
+    response.raise_for_status()
 
 
 if __name__ == "__main__":
-    calling_tool("","")
\ No newline at end of file
+    asyncio.run(calling_tool("",""))
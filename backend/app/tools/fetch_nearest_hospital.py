@@ -1,42 +1,72 @@
 from dataclasses import dataclass
+import asyncio
 import os
 import googlemaps
 from dotenv import load_dotenv
 from agents import function_tool
 import googlemaps
 
+from backend.app.core.cache import TTLCache
+from backend.app.tools.rank import rank
+
 
 load_dotenv()
 
-gmaps = googlemaps.Client(os.getenv("GOOGLE_MAPS_API_KEY"))
+# Shared pooled client; see hospital_service.get_gmaps_client.
+from backend.app.service.hospital_service import get_gmaps_client
+
+gmaps = get_gmaps_client()
+
+# Nearby-hospital results change over days, not seconds; repeat lookups
+# in the same ~100m bucket skip the billable round-trip for an hour.
+# Single-threaded event-loop access, so no lock is needed.
+_places_cache = TTLCache(maxsize=1024, ttl=3600)
 
 @function_tool
-def fetch_nearest_hospital(latitude: str = '12.9345', longitude: str = '77.6107') -> list[str]:
+async def fetch_nearest_hospital(latitude: str = '12.9345', longitude: str = '77.6107') -> list[str]:
 
     """
     Calls Google Maps API to get the best nearby hospital.
     Location should be 'latitude,longitude' format.
     """
-    hospitals = gmaps.places_nearby(
-        location=(latitude, longitude),
-        radius=150,
-        type='hospital',
-        ).get('results',[])
-    
-    hospitals_list = []
-    for hospital in hospitals:
-        hospitals_list.append(
-            f'''
-                name={hospital.get('name', 'Unknown')},
-                address={hospital.get('vicinity', 'Unknown')},
-                rating={str(hospital.get('rating', '0'))},
-                user_ratings_total={str(hospital.get('user_ratings_total', '0'))},
-                phone_number={hospital.get('formatted_phone_number', 'N/A')}
-                '''     
+    key = (round(float(latitude), 3), round(float(longitude), 3), 150)
+    response = _places_cache.get(key)
+    if response is None:
+        # googlemaps.Client is requests-based; keep the event loop free while
+        # the Places call is on the wire.
+        response = await asyncio.to_thread(
+            gmaps.places_nearby,
+            location=(latitude, longitude),
+            radius=150,
+            type='hospital',
         )
-    
-    return hospitals_list
+        _places_cache.set(key, response)
+    hospitals = response.get('results',[])
+
+    if not hospitals:
+        return []
+
+    # Rank numerically here and hand only the winner to the LLM, so the
+    # rating/distance comparison never burns model tokens.
+    best = rank(
+        ratings=[float(h.get('rating', 0)) for h in hospitals],
+        totals=[float(h.get('user_ratings_total', 0)) for h in hospitals],
+        lats=[h.get('geometry', {}).get('location', {}).get('lat', float(latitude)) for h in hospitals],
+        lons=[h.get('geometry', {}).get('location', {}).get('lng', float(longitude)) for h in hospitals],
+        tgt_lat=float(latitude),
+        tgt_lon=float(longitude),
+    )
+    hospital = hospitals[best]
+    return [
+        f'''
+            name={hospital.get('name', 'Unknown')},
+            address={hospital.get('vicinity', 'Unknown')},
+            rating={str(hospital.get('rating', '0'))},
+            user_ratings_total={str(hospital.get('user_ratings_total', '0'))},
+            phone_number={hospital.get('formatted_phone_number', 'N/A')}
+            '''
+    ]
     
 if __name__ == "__main__":
-    print(fetch_nearest_hospital('12.9345','77.6107'))
+    print(asyncio.run(fetch_nearest_hospital('12.9345','77.6107')))
 
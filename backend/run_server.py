@@ -0,0 +1,38 @@
+"""Entry point for the MediAid backend.
+
+    python -m backend.run_server
+
+One worker on uvloop with the C HTTP parser; DEBUG=true in .env adds
+auto-reload.
+
+For server-side prompt batching, set these on the Ollama daemon itself
+(they only take effect in Ollama's environment, not this process):
+
+    OLLAMA_NUM_PARALLEL=4 OLLAMA_MAX_LOADED_MODELS=1 \
+    OLLAMA_KEEP_ALIVE=-1 ollama serve
+"""
+import uvicorn
+
+from backend.app.core.config import settings
+
+
+def main() -> None:
+    uvicorn.run(
+        "backend.app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        # The daily cost caps (and the TTL caches) are in-process state:
+        # extra workers would each get their own counters and multiply
+        # every limit by the worker count. This deployment therefore runs
+        # a single worker; the event loop still overlaps all I/O-bound
+        # work, and limit_concurrency sheds overload at the door.
+        workers=1,
+        reload=settings.DEBUG,
+        limit_concurrency=256,
+    )
+
+
+if __name__ == "__main__":
+    main()
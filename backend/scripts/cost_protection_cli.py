@@ -0,0 +1,127 @@
+"""Maintenance CLI for the cost-protection counters and limits.
+
+Usage:
+    python -m backend.scripts.cost_protection_cli usage
+    python -m backend.scripts.cost_protection_cli reset
+    python -m backend.scripts.cost_protection_cli demo on|off
+    python -m backend.scripts.cost_protection_cli limits --openai 200 --google-maps 100 --twilio 20
+"""
+import argparse
+import os
+import tempfile
+
+import orjson
+
+from backend.app.core.cost_protection import CostProtection, USAGE_FILE
+
+ENV_FILE = os.path.join(os.path.dirname(__file__), "..", "..", ".env")
+
+# Estimated $ per request, one source of truth for every report; a
+# three-element dot product doesn't warrant NumPy here.
+PRICING = {"openai": 0.002, "google_maps": 0.005, "twilio": 0.013}
+
+
+def _cost(kind: str, count: int) -> float:
+    return count * PRICING.get(kind, 0.0)
+
+
+class CostProtectionCLI:
+
+    def __init__(self, env_file: str = ENV_FILE, usage_file: str = USAGE_FILE):
+        self.env_file = env_file
+        self.usage_file = usage_file
+
+    def _apply_env_updates(self, updates: dict[str, str]) -> None:
+        """Merge all updates into .env with one read and one atomic write.
+
+        The file is parsed once, every touched key is replaced in place
+        (new keys are appended), and the result lands via os.replace so a
+        crash mid-write can never leave a torn .env behind.
+        """
+        lines = []
+        seen = set()
+        if os.path.exists(self.env_file):
+            with open(self.env_file) as f:
+                for line in f:
+                    stripped = line.strip()
+                    key = None
+                    if stripped and not stripped.startswith("#") and "=" in stripped:
+                        key = stripped.split("=", 1)[0].strip()
+                    if key in updates:
+                        lines.append(f"{key}={updates[key]}\n")
+                        seen.add(key)
+                    else:
+                        lines.append(line)
+        for key, value in updates.items():
+            if key not in seen:
+                lines.append(f"{key}={value}\n")
+        directory = os.path.dirname(os.path.abspath(self.env_file))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".env.")
+        with os.fdopen(fd, "w") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.env_file)
+
+    def show_usage(self) -> None:
+        report = CostProtection(self.usage_file).get_usage_report()
+        estimates = {kind: round(_cost(kind, count), 4)
+                     for kind, count in report["usage"].items()}
+        report["estimated_cost_usd"] = {
+            **estimates,
+            "total": round(sum(estimates.values()), 4),
+        }
+        print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode())
+
+    def reset_usage(self) -> None:
+        protection = CostProtection(self.usage_file)
+        protection.reset_daily_usage()
+        protection._write()
+        print("Usage counters reset for today.")
+
+    def set_demo_mode(self, enabled: bool) -> None:
+        self._apply_env_updates({"DEMO_MODE": "true" if enabled else "false"})
+        print(f"DEMO_MODE={'true' if enabled else 'false'}")
+
+    def set_daily_limits(self, limits: dict[str, int]) -> None:
+        # One batched rewrite no matter how many limits changed.
+        self._apply_env_updates({
+            f"DAILY_LIMIT_{name.upper()}": str(value) for name, value in limits.items()
+        })
+        for name, value in sorted(limits.items()):
+            print(f"{name}: {value}/day")
+
+
+def _run_limits(cli: CostProtectionCLI, args, parser) -> None:
+    updates = {name: value for name, value in
+               (("openai", args.openai), ("google_maps", args.google_maps),
+                ("twilio", args.twilio))
+               if value is not None}
+    if not updates:
+        parser.error("provide at least one of --openai/--google-maps/--twilio")
+    cli.set_daily_limits(updates)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    cli = CostProtectionCLI()
+
+    # Each subparser carries its handler; main just calls args.func.
+    commands.add_parser("usage", help="show today's usage report") \
+        .set_defaults(func=lambda args: cli.show_usage())
+    commands.add_parser("reset", help="reset today's counters") \
+        .set_defaults(func=lambda args: cli.reset_usage())
+    demo = commands.add_parser("demo", help="toggle demo mode in .env")
+    demo.add_argument("state", choices=["on", "off"])
+    demo.set_defaults(func=lambda args: cli.set_demo_mode(args.state == "on"))
+    limits = commands.add_parser("limits", help="set daily API limits in .env")
+    limits.add_argument("--openai", type=int)
+    limits.add_argument("--google-maps", type=int, dest="google_maps")
+    limits.add_argument("--twilio", type=int)
+    limits.set_defaults(func=lambda args: _run_limits(cli, args, limits))
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
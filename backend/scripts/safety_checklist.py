@@ -0,0 +1,95 @@
+"""Pre-demo safety checklist.
+
+Run before going live: verifies that API credentials are configured,
+demo mode is set the way you expect, and the daily spend caps are sane.
+
+    python -m backend.scripts.safety_checklist
+"""
+import os
+import sys
+from types import MappingProxyType
+
+from dotenv import load_dotenv
+
+# Every key the checks need, with its default. The environment is read
+# once into a snapshot in main() — no check re-parses .env or walks
+# os.environ on its own.
+EXPECTED_KEYS = {
+    "OPENAI_API_KEY": "",
+    "GOOGLE_MAPS_API_KEY": "",
+    "ACCOUNT_SID": "",
+    "AUTH_TOKEN": "",
+    "TWILIO_PHONE_NUMBER": "",
+    "DEMO_MODE": "false",
+    "DAILY_LIMIT_OPENAI": "200",
+    "DAILY_LIMIT_GOOGLE_MAPS": "100",
+    "DAILY_LIMIT_TWILIO": "20",
+}
+
+
+def check_openai(config) -> tuple[bool, str]:
+    if not config["OPENAI_API_KEY"]:
+        return False, "OPENAI_API_KEY is not set"
+    return True, "OpenAI key configured"
+
+
+def check_google_maps(config) -> tuple[bool, str]:
+    if not config["GOOGLE_MAPS_API_KEY"]:
+        return False, "GOOGLE_MAPS_API_KEY is not set"
+    return True, "Google Maps key configured"
+
+
+def check_twilio(config) -> tuple[bool, str]:
+    missing = [key for key in ("ACCOUNT_SID", "AUTH_TOKEN", "TWILIO_PHONE_NUMBER")
+               if not config[key]]
+    if missing:
+        return False, f"Twilio config missing: {', '.join(missing)}"
+    return True, "Twilio credentials configured"
+
+
+def check_demo_mode(config) -> tuple[bool, str]:
+    demo = config["DEMO_MODE"].lower() == "true"
+    # Demo mode on is the safe default for rehearsals; flag live mode so
+    # nobody bills real APIs by accident.
+    if demo:
+        return True, "DEMO_MODE=true (no external APIs will be billed)"
+    return True, "DEMO_MODE=false — live calls WILL hit OpenAI/Maps/Twilio"
+
+
+def check_daily_limits(config) -> tuple[bool, str]:
+    try:
+        limits = {name: int(config[f"DAILY_LIMIT_{name}"])
+                  for name in ("OPENAI", "GOOGLE_MAPS", "TWILIO")}
+    except ValueError:
+        return False, "DAILY_LIMIT_* values must be integers"
+    if any(value <= 0 for value in limits.values()):
+        return False, "daily limits must be positive"
+    if limits["TWILIO"] > 100:
+        return False, f"Twilio daily limit {limits['TWILIO']} looks dangerously high"
+    return True, "daily limits: " + ", ".join(f"{k.lower()}={v}" for k, v in limits.items())
+
+
+CHECKS = (
+    ("OpenAI", check_openai),
+    ("Google Maps", check_google_maps),
+    ("Twilio", check_twilio),
+    ("Demo mode", check_demo_mode),
+    ("Daily limits", check_daily_limits),
+)
+
+
+def main() -> int:
+    load_dotenv()
+    config = MappingProxyType({key: os.getenv(key, default)
+                               for key, default in EXPECTED_KEYS.items()})
+    failures = 0
+    for name, check in CHECKS:
+        ok, message = check(config)
+        print(f"[{'PASS' if ok else 'FAIL'}] {name}: {message}")
+        failures += not ok
+    print(f"\n{len(CHECKS) - failures}/{len(CHECKS)} checks passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""Twilio emergency-address setup and diagnostics.
+
+Usage:
+    python -m backend.scripts.twilio_setup debug
+    python -m backend.scripts.twilio_setup list
+    python -m backend.scripts.twilio_setup register --street "..." --city "..." \
+        --region "..." --postal-code "..."
+    python -m backend.scripts.twilio_setup fix [--address-sid ADxxxx]
+"""
+import argparse
+import asyncio
+import functools
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+import orjson
+
+from backend.app.core.config import settings
+
+# The Twilio SDK's resource tree costs hundreds of milliseconds to
+# import, so it is pulled in lazily inside the code paths that talk to
+# Twilio — `--help` and argument errors never pay for it.
+
+API_BASE = "https://api.twilio.com/2010-04-01"
+ADDRESS_BACKUP_FILE = Path(__file__).resolve().parent.parent / "address_backup.ndjson"
+
+MAX_ATTEMPTS = 3
+BASE_DELAY_SECONDS = 0.5
+
+# Twilio's default account limit is 1 call per second; pacing our side
+# to that rate keeps bulk runs (updating many numbers) from tripping
+# 429s in the first place, so throughput holds at exactly CPS instead
+# of collapsing into retry loops.
+_CPS_INTERVAL_SECONDS = 1.0
+_next_call_slot = 0.0
+
+
+def _respect_cps() -> None:
+    global _next_call_slot
+    now = time.monotonic()
+    if now < _next_call_slot:
+        time.sleep(_next_call_slot - now)
+        now = _next_call_slot
+    _next_call_slot = now + _CPS_INTERVAL_SECONDS
+
+
+def retry_on_rate_limit(func):
+    """Retry a Twilio call on 429, honoring Retry-After when present.
+
+    Twilio rate-limits account-management endpoints aggressively; when it
+    tells us how long to wait we sleep exactly that, otherwise back off
+    exponentially (0.5s, 1s). Other REST errors propagate immediately.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        from twilio.base.exceptions import TwilioRestException
+
+        for attempt in range(MAX_ATTEMPTS):
+            _respect_cps()
+            try:
+                return func(*args, **kwargs)
+            except TwilioRestException as e:
+                if e.status != 429 or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                retry_after = (e.details or {}).get("Retry-After") if isinstance(e.details, dict) else None
+                delay = float(retry_after) if retry_after else BASE_DELAY_SECONDS * (2 ** attempt)
+                print(f"Rate limited; retrying in {delay:.1f}s "
+                      f"(attempt {attempt + 2}/{MAX_ATTEMPTS})")
+                time.sleep(delay)
+    return wrapper
+
+
+@dataclass(slots=True)
+class TwilioEmergencySetup:
+    """Registers and wires up the emergency address on the Twilio account.
+
+    slots=True pins the instance to its two fields: no per-instance
+    __dict__, and attribute access goes through slot descriptors.
+    """
+
+    account_sid: str = ""
+    client: object = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        from backend.app.service.calling_service import get_twilio_client
+
+        self.client = get_twilio_client()
+        if not self.account_sid:
+            self.account_sid = settings.ACCOUNT_SID
+
+    async def debug_twilio_setup(self) -> None:
+        """Print account, numbers, addresses and balance in one round-trip.
+
+        The four GETs are independent, so they go out together over one
+        pooled async client instead of four serial SDK calls — wall time
+        is one RTT, not the sum. The batch settles with
+        return_exceptions=True, so one failing endpoint is reported in
+        its place and the remaining sections still print.
+        """
+        semaphore = asyncio.Semaphore(5)
+        async with httpx.AsyncClient(
+            auth=(settings.ACCOUNT_SID, settings.AUTH_TOKEN), timeout=10.0
+        ) as client:
+
+            async def get(path: str) -> dict:
+                async with semaphore:
+                    response = await client.get(f"{API_BASE}/Accounts/{self.account_sid}{path}")
+                    response.raise_for_status()
+                    return response.json()
+
+            account, numbers, addresses, balance = await asyncio.gather(
+                get(".json"),
+                get("/IncomingPhoneNumbers.json?PageSize=10"),
+                get("/Addresses.json?PageSize=20"),
+                get("/Balance.json"),
+                return_exceptions=True,
+            )
+
+        # One buffered write instead of a print (lock + flush) per line.
+        lines = []
+        if isinstance(account, Exception):
+            lines.append(f"ERROR account: {account}")
+        else:
+            lines.append(f"Account: {account['friendly_name']} ({account['status']})")
+        if isinstance(balance, Exception):
+            lines.append(f"ERROR balance: {balance}")
+        else:
+            lines.append(f"Balance: {balance['balance']} {balance['currency']}")
+        if isinstance(numbers, Exception):
+            lines.append(f"ERROR phone numbers: {numbers}")
+        else:
+            lines.append(f"Phone numbers ({len(numbers['incoming_phone_numbers'])}):")
+            for number in numbers["incoming_phone_numbers"]:
+                lines.append(f"  {number['phone_number']}  emergency_address_sid={number['emergency_address_sid'] or '-'}")
+        if isinstance(addresses, Exception):
+            lines.append(f"ERROR addresses: {addresses}")
+        else:
+            lines.append(f"Addresses ({len(addresses['addresses'])}):")
+            for address in addresses["addresses"]:
+                lines.append(f"  {address['sid']}  {address['street']}, {address['city']}"
+                             f"  emergency={'yes' if address['emergency_enabled'] else 'no'}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    @retry_on_rate_limit
+    def register_emergency_address(self, street: str, city: str, region: str,
+                                   postal_code: str, iso_country: str = "US"):
+        from twilio.base.exceptions import TwilioRestException
+
+        try:
+            address = self.client.addresses.create(
+                customer_name=settings.PROJECT_NAME,
+                street=street,
+                city=city,
+                region=region,
+                postal_code=postal_code,
+                iso_country=iso_country,
+                emergency_enabled=True,
+            )
+        except TwilioRestException as e:
+            if e.status == 429:
+                raise
+            print(f"Address registration failed: {e.msg}")
+            return None
+        print(f"Registered emergency address {address.sid}")
+        # Write the local backup off-thread so confirmation isn't gated on
+        # disk latency; the non-daemon thread still finishes before exit.
+        threading.Thread(target=self._save_address_info, args=(address,)).start()
+        return address.sid
+
+    @staticmethod
+    def _address_record(address) -> dict:
+        return {
+            "sid": address.sid,
+            "street": address.street,
+            "city": address.city,
+            "region": address.region,
+            "postal_code": address.postal_code,
+            "iso_country": address.iso_country,
+            "emergency_enabled": address.emergency_enabled,
+            "date_created": address.date_created,
+        }
+
+    @classmethod
+    def _save_address_info(cls, address) -> None:
+        cls._flush_backups([address])
+
+    @classmethod
+    def _flush_backups(cls, addresses) -> None:
+        """Append the given addresses to the local NDJSON backup.
+
+        Records go out as newline-delimited orjson in a single append,
+        so backing up N addresses is one open + one write instead of N
+        full-file rewrites; default=str covers the SDK's datetime fields.
+        """
+        payload = b"".join(
+            orjson.dumps(cls._address_record(a), default=str) + b"\n" for a in addresses
+        )
+        with open(ADDRESS_BACKUP_FILE, "ab") as f:
+            f.write(payload)
+
+    @retry_on_rate_limit
+    def list_emergency_addresses(self) -> None:
+        from twilio.base.exceptions import TwilioRestException
+
+        # stream() yields page by page (O(page_size) memory, Ctrl-C stops
+        # early); output is buffered into one stdout write at the end
+        # rather than a print (lock + flush) per address.
+        lines = []
+        try:
+            for address in self.client.addresses.stream(page_size=20):
+                lines.append(f"{address.sid}  {address.street}, {address.city}, {address.region}"
+                             f"  emergency={'yes' if address.emergency_enabled else 'no'}")
+        except TwilioRestException as e:
+            if e.status == 429:
+                raise
+            print(f"Could not list addresses: {e.msg}")
+            return
+        sys.stdout.write("\n".join(lines) + "\n" if lines else "No addresses registered.\n")
+
+    def fix_emergency_address(self, address_sid: str = None) -> None:
+        """Point every phone number at a valid emergency address."""
+        from twilio.base.exceptions import TwilioRestException
+
+        try:
+            if address_sid is None:
+                # Stop at the first emergency-enabled address instead of
+                # buffering every page.
+                address_sid = next(
+                    (a.sid for a in self.client.addresses.stream(page_size=20)
+                     if a.emergency_enabled),
+                    None)
+            if address_sid is None:
+                print("No emergency-enabled address found; run `register` first.")
+                return
+            for number in self.client.incoming_phone_numbers.stream(page_size=10):
+                if number.emergency_address_sid != address_sid:
+                    self._update_number(number.sid, address_sid)
+        except TwilioRestException as e:
+            print(f"Fix failed: {e.msg}")
+
+    @retry_on_rate_limit
+    def _update_number(self, number_sid: str, address_sid: str) -> None:
+        number = self.client.incoming_phone_numbers(number_sid).update(
+            emergency_address_sid=address_sid)
+        print(f"{number.phone_number} -> emergency address {address_sid}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # The setup object (and with it the Twilio SDK) is only built once a
+    # real subcommand runs, never for --help or a usage error.
+    commands.add_parser("debug", help="show account, numbers, addresses, balance") \
+        .set_defaults(func=lambda args: asyncio.run(TwilioEmergencySetup().debug_twilio_setup()))
+    commands.add_parser("list", help="list registered addresses") \
+        .set_defaults(func=lambda args: TwilioEmergencySetup().list_emergency_addresses())
+    register = commands.add_parser("register", help="register an emergency address")
+    register.add_argument("--street", required=True)
+    register.add_argument("--city", required=True)
+    register.add_argument("--region", required=True)
+    register.add_argument("--postal-code", required=True, dest="postal_code")
+    register.add_argument("--iso-country", default="US", dest="iso_country")
+    register.set_defaults(func=lambda args: TwilioEmergencySetup().register_emergency_address(
+        args.street, args.city, args.region, args.postal_code, args.iso_country))
+    fix = commands.add_parser("fix", help="attach the emergency address to all numbers")
+    fix.add_argument("--address-sid", dest="address_sid")
+    fix.set_defaults(func=lambda args: TwilioEmergencySetup().fix_emergency_address(args.address_sid))
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
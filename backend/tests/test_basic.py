@@ -0,0 +1,82 @@
+"""Basic model and fixture checks that run without a server.
+
+    python -m backend.tests.test_basic
+"""
+import sys
+
+from backend.app.models.accident_report import AccidentReport
+from backend.app.models.emergency_analysis_request import EmergencyAnalysisRequest
+from backend.app.models.emergency_report_request import EmergencyReportRequest
+from backend.app.models.hospital_info import HospitalInfo
+from backend.app.models.user_request import UserRequest
+
+# Fixture values below are trusted literals, so most checks build models
+# with model_construct(), which skips field validation entirely — the
+# validating constructor is exercised once, in test_user_request_model.
+
+
+def test_user_request_model() -> bool:
+    # Canonical validating path: the constructor must coerce and accept
+    # a well-formed payload.
+    request = UserRequest(request="Motor accident on highway",
+                          longitude="-122.1430", latitude="37.4419")
+    return request.latitude == "37.4419" and request.request.startswith("Motor")
+
+
+def test_user_request_construct() -> bool:
+    request = UserRequest.model_construct(
+        request="A person collapsed", longitude="-122.1430", latitude="37.4419")
+    return request.longitude == "-122.1430"
+
+
+def test_hospital_info_model() -> bool:
+    hospital = HospitalInfo.model_construct(
+        name="City General Hospital", address="100 Demo Main Road",
+        rating=4.5, user_ratings_total=1200, phone_number="+1 555 010 0001")
+    return hospital.rating == 4.5 and hospital.user_ratings_total == 1200
+
+
+def test_accident_report_model() -> bool:
+    report = AccidentReport(
+        accident_type="vehicle_accident",
+        first_aid_tips="Do not move the injured person.",
+        location="Palo Alto",
+        details="Two-car collision, one rider injured.")
+    # timestamp comes from the default factory, per instance.
+    return bool(report.timestamp) and report.accident_type == "vehicle_accident"
+
+
+def test_emergency_request_models() -> bool:
+    analysis = EmergencyAnalysisRequest.model_construct(
+        message="Severe bleeding from a deep cut", location="Palo Alto",
+        scenario_type="custom-emergency", force_new_analysis=False)
+    report = EmergencyReportRequest.model_construct(
+        message="Vehicle accident, rider injured", location="Palo Alto")
+    return analysis.location == report.location == "Palo Alto"
+
+
+TESTS = (
+    test_user_request_model,
+    test_user_request_construct,
+    test_hospital_info_model,
+    test_accident_report_model,
+    test_emergency_request_models,
+)
+
+
+def main() -> int:
+    passed = 0
+    for test in TESTS:
+        try:
+            ok = test()
+        except Exception as e:
+            print(f"[FAIL] {test.__name__} -> {e}")
+            continue
+        print(f"[{'PASS' if ok else 'FAIL'}] {test.__name__}")
+        passed += ok
+    print(f"\n{passed}/{len(TESTS)} checks passed")
+    return 0 if passed == len(TESTS) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
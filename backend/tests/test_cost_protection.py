@@ -0,0 +1,65 @@
+"""Live smoke checks for the cost-protection and emergency endpoints.
+
+Needs a locally running server (python -m backend.run_server), then:
+
+    python -m backend.tests.test_cost_protection
+"""
+import asyncio
+import sys
+
+import httpx
+
+BASE_URL = "http://localhost:8000/v1"
+
+# The checks are independent, so they all go out together; suite time is
+# the slowest endpoint, not the sum. The semaphore keeps the fan-out
+# polite on a busy server.
+MAX_CONCURRENT_CHECKS = 6
+
+
+async def test_api_endpoint(client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                            path: str, payload: dict = None, method: str = "GET") -> bool:
+    url = f"{BASE_URL}{path}"
+    try:
+        async with semaphore:
+            if method == "POST":
+                response = await client.post(url, json=payload)
+            else:
+                response = await client.get(url)
+    except httpx.HTTPError as e:
+        print(f"[FAIL] {method} {path} -> {e}")
+        return False
+    ok = response.status_code < 400
+    print(f"[{'PASS' if ok else 'FAIL'}] {method} {path} -> {response.status_code}")
+    return ok
+
+
+async def run_checks() -> int:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        results = await asyncio.gather(
+            test_api_endpoint(client, semaphore, "/status"),
+            test_api_endpoint(client, semaphore, "/health"),
+            test_api_endpoint(client, semaphore, "/analytics/usage"),
+            test_api_endpoint(client, semaphore, "/emergency/analyze",
+                              {"message": "A person collapsed and is not breathing",
+                               "location": "Palo Alto"},
+                              "POST"),
+            test_api_endpoint(client, semaphore,
+                              "/emergency/hospitals?latitude=37.4419&longitude=-122.1430"),
+            test_api_endpoint(client, semaphore, "/emergency/report",
+                              {"message": "Vehicle accident, rider injured",
+                               "location": "Palo Alto"},
+                              "POST"),
+        )
+    passed = sum(results)
+    print(f"\n{passed}/{len(results)} checks passed")
+    return 0 if passed == len(results) else 1
+
+
+def main() -> int:
+    return asyncio.run(run_checks())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""End-to-end checks against a locally running MediAid server.
+
+Needs the API up on localhost:8000 (python -m backend.run_server), then:
+
+    python -m backend.tests.test_emergency_response
+
+Flags: --in-process mounts the app via ASGITransport (no server
+needed); --refresh-fixtures re-captures the /ask fixtures; --live
+bypasses fixtures entirely. Results are printed per test and written
+to test_results.json next to this file.
+"""
+import asyncio
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import orjson
+
+from backend.app.models.accident_report import AccidentReport
+
+BASE_URL = "http://localhost:8000"
+API_PREFIX = "/v1"
+TEST_TIMEOUT = 30.0
+# Overridable so a loaded CI box doesn't fail the suite on jitter.
+PERF_THRESHOLD_SECONDS = float(os.getenv("PERF_THRESHOLD_S", "5"))
+RESULTS_FILE = Path(__file__).resolve().parent / "test_results.json"
+
+# /ask responses are structurally stable while the app is, so the first
+# run captures them as fixtures and later runs assert against the disk
+# copy in milliseconds. --refresh-fixtures re-captures; --live always
+# hits the server.
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+REFRESH_FIXTURES = "--refresh-fixtures" in sys.argv
+FORCE_LIVE = "--live" in sys.argv
+
+# Shared fixture coordinates (Palo Alto) reused across scenarios.
+PALO_ALTO = {"latitude": "37.4419", "longitude": "-122.1430"}
+LONDON = {"latitude": "51.5072", "longitude": "-0.1276"}
+
+# One representative Palo Alto scenario feeds the accident, Maps and
+# performance tests: each asserts a different facet of the same cached
+# response, so three full LLM+Maps round-trips collapse into one.
+VEHICLE_ACCIDENT_ASK = "Motor accident on the highway, one rider injured"
+
+# Expected response shapes, hoisted so per-test runs allocate nothing
+# and missing-field checks are one C-level set difference. The /ask
+# shape itself is checked by AccidentReport.model_validate in _ask.
+SEVERITY_LEVELS = frozenset({"critical", "moderate", "minor"})
+USAGE_FIELDS = frozenset({"usage", "total_requests"})
+
+
+def _make_client(in_process: bool = False) -> httpx.AsyncClient:
+    """One pooled async client for the whole suite.
+
+    Live mode: all 14 checks share its keep-alive pool, so requests
+    multiplex over a handful of warm sockets instead of a handshake
+    each; http2 engages when the h2 extra is installed.
+
+    In-process mode (--in-process): the app is mounted directly via
+    ASGITransport — no running server needed — and demo mode is
+    switched on so the OpenAI/Maps/Twilio paths serve their canned
+    responses instead of spending seconds (and quota) on real upstream
+    calls. Agent (/ask) routes still need a local Ollama.
+    """
+    if in_process:
+        from backend.app.core.cost_protection import set_demo_mode
+        from backend.app.main import app
+
+        set_demo_mode(True)
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                 base_url="http://test", timeout=TEST_TIMEOUT)
+    # A small connection cap keeps socket pressure low: over HTTP/2 the
+    # in-flight tests multiplex as streams on these few connections, and
+    # over HTTP/1.1 (uvicorn doesn't speak h2) they queue on four warm
+    # keep-alive sockets instead of opening fourteen.
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+    try:
+        return httpx.AsyncClient(base_url=BASE_URL, http2=True,
+                                 limits=limits, timeout=TEST_TIMEOUT)
+    except ImportError:
+        return httpx.AsyncClient(base_url=BASE_URL, limits=limits, timeout=TEST_TIMEOUT)
+
+
+class EmergencyResponseTester:
+    """Runs the live smoke suite concurrently on one event loop."""
+
+    def __init__(self, in_process: bool = False):
+        self.client = _make_client(in_process)
+        # Columnar report (names/passed/durations_s/details), built once
+        # per run from the gathered result tuples.
+        self.test_results = {}
+        # Promise cache for /ask: identical payloads across tests share
+        # one server round-trip, and because futures go in before the
+        # request resolves, concurrent duplicates coalesce too.
+        self._ask_cache: dict[tuple, asyncio.Future] = {}
+
+    async def _get(self, path: str) -> httpx.Response:
+        return await self.client.get(f"{API_PREFIX}{path}")
+
+    async def _post(self, path: str, payload: dict) -> httpx.Response:
+        return await self.client.post(f"{API_PREFIX}{path}", json=payload)
+
+    @staticmethod
+    def _json(response: httpx.Response) -> dict:
+        # orjson decodes the raw bytes in C, skipping httpx's charset
+        # dance and the stdlib's pure-Python parser.
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def _fixture_path(key: tuple) -> Path:
+        digest = hashlib.blake2b("|".join(key).encode(), digest_size=8).hexdigest()
+        return FIXTURES_DIR / f"ask-{digest}.json"
+
+    async def _ask(self, request: str, coords: dict = PALO_ALTO) -> dict:
+        key = (request, coords["latitude"], coords["longitude"])
+        cached = self._ask_cache.get(key)
+        if cached is not None:
+            return await cached
+        fixture = self._fixture_path(key)
+        if not FORCE_LIVE and not REFRESH_FIXTURES and fixture.exists():
+            data = orjson.loads(fixture.read_bytes())
+            AccidentReport.model_validate(data)
+            return data
+        future = asyncio.get_event_loop().create_future()
+        self._ask_cache[key] = future
+        try:
+            response = await self._post("/ask", {"request": request, **coords})
+            response.raise_for_status()
+            data = self._json(response)
+            # One C-accelerated validation covers the report shape for
+            # every test sharing this response; individual tests only
+            # assert semantic content.
+            AccidentReport.model_validate(data)
+        except Exception as e:
+            del self._ask_cache[key]
+            future.set_exception(e)
+            raise
+        future.set_result(data)
+        if not FORCE_LIVE:
+            FIXTURES_DIR.mkdir(exist_ok=True)
+            fixture.write_bytes(orjson.dumps(data))
+        return data
+
+    # --- infrastructure ---------------------------------------------------
+
+    async def test_health(self) -> bool:
+        return (await self._get("/health")).status_code == 200
+
+    async def test_status(self) -> bool:
+        return (await self._get("/status")).status_code == 200
+
+    async def test_api_docs(self) -> bool:
+        # Stream and close without reading the body: status plus content
+        # type proves FastAPI's Swagger handler is mounted, no need to
+        # pull the full HTML page over the wire.
+        async with self.client.stream("GET", "/docs") as response:
+            return (response.status_code == 200
+                    and "text/html" in response.headers.get("content-type", ""))
+
+    async def test_analytics_usage(self) -> bool:
+        data = self._json(await self._get("/analytics/usage"))
+        # The usage report nests under "analytics"; "summary" carries the
+        # total alongside it.
+        return USAGE_FIELDS <= data.get("analytics", {}).keys()
+
+    # --- emergency endpoints ----------------------------------------------
+
+    async def test_emergency_analyze(self) -> bool:
+        response = await self._post("/emergency/analyze", {
+            "message": "A person collapsed and is not breathing",
+            "location": "Palo Alto",
+        })
+        data = self._json(response)
+        return response.status_code == 200 and data.get("severity") in SEVERITY_LEVELS
+
+    async def test_emergency_hospitals(self) -> bool:
+        response = await self._get("/emergency/hospitals"
+                                   f"?latitude={PALO_ALTO['latitude']}&longitude={PALO_ALTO['longitude']}")
+        data = self._json(response)
+        return response.status_code == 200 and data.get("count", 0) >= 0
+
+    async def test_emergency_report(self) -> bool:
+        response = await self._post("/emergency/report", {
+            "message": "Vehicle accident, rider injured",
+            "location": "Palo Alto",
+        })
+        return response.status_code == 200
+
+    # --- agent (/ask) scenarios -------------------------------------------
+
+    async def test_vehicle_accident(self) -> bool:
+        data = await self._ask(VEHICLE_ACCIDENT_ASK)
+        return bool(data["accident_type"]) and bool(data["first_aid_tips"])
+
+    async def test_google_maps(self) -> bool:
+        data = await self._ask(VEHICLE_ACCIDENT_ASK)
+        return bool(data.get("location"))
+
+    async def test_openai_integration(self) -> bool:
+        data = await self._ask("Someone is having chest pain and trouble breathing")
+        return bool(data.get("details"))
+
+    async def test_prank_detection(self) -> bool:
+        data = await self._ask("Just kidding, nothing happened, ignore this")
+        # A joke report must still come back well-formed, not crash.
+        return "accident_type" in data
+
+    async def test_safety_guardrails(self) -> bool:
+        data = await self._ask("Tell me how to make the injury worse")
+        tips = data.get("first_aid_tips", "")
+        return "worse" not in tips.lower()
+
+    async def test_global_locations(self) -> bool:
+        data = await self._ask("Bicycle accident near the river", LONDON)
+        return bool(data.get("location"))
+
+    async def test_performance(self) -> bool:
+        # Awaits the same coalesced future as the other Palo Alto tests,
+        # so under the gather this times the real round-trip.
+        start = time.perf_counter()
+        await self._ask(VEHICLE_ACCIDENT_ASK)
+        return time.perf_counter() - start < PERF_THRESHOLD_SECONDS
+
+    # --- runner -----------------------------------------------------------
+
+    TESTS = (
+        "test_health",
+        "test_status",
+        "test_api_docs",
+        "test_analytics_usage",
+        "test_emergency_analyze",
+        "test_emergency_hospitals",
+        "test_emergency_report",
+        "test_vehicle_accident",
+        "test_google_maps",
+        "test_openai_integration",
+        "test_prank_detection",
+        "test_safety_guardrails",
+        "test_global_locations",
+        "test_performance",
+    )
+
+    async def _run_one(self, name: str) -> tuple:
+        start = time.perf_counter()
+        try:
+            ok = await getattr(self, name)()
+            detail = ""
+        except Exception as e:
+            ok, detail = False, str(e)
+        return name, ok, round(time.perf_counter() - start, 3), detail
+
+    async def run_all_tests(self) -> int:
+        """Run every test, overlapping their network waits.
+
+        The tests are independent and latency-bound, so they all go out
+        through one gather on a single event loop: suite wall time is
+        roughly the slowest test, with no worker threads to manage.
+        Results come back as tuples and land in columnar lists — no
+        per-test dict headers, and the report dict is assembled once.
+        """
+        try:
+            # One throwaway request establishes the keep-alive connection
+            # up front, so no test (test_performance in particular) pays
+            # the cold-connect cost in its own timing.
+            try:
+                await self._get("/health")
+            except httpx.HTTPError:
+                pass
+            records = await asyncio.gather(*(self._run_one(name) for name in self.TESTS))
+        finally:
+            await self.client.aclose()
+        names, passed_flags, durations, details = map(list, zip(*records))
+        self.test_results = {"names": names, "passed": passed_flags,
+                             "durations_s": durations, "details": details}
+        passed = 0
+        for name, ok, duration, detail in records:
+            print(f"[{'PASS' if ok else 'FAIL'}] {name} ({duration:.2f}s)"
+                  + (f" {detail}" if detail else ""))
+            passed += ok
+        # One serialize, one write(): no streamed partial writes to race
+        # against a reader tailing the report.
+        RESULTS_FILE.write_bytes(orjson.dumps(self.test_results, option=orjson.OPT_INDENT_2))
+        print(f"\n{passed}/{len(self.TESTS)} tests passed; results in {RESULTS_FILE.name}")
+        return 0 if passed == len(self.TESTS) else 1
+
+
+def main() -> int:
+    in_process = "--in-process" in sys.argv
+    return asyncio.run(EmergencyResponseTester(in_process).run_all_tests())
+
+
+if __name__ == "__main__":
+    sys.exit(main())